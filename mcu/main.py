@@ -3,7 +3,9 @@ import ssd1306
 import usocket as socket
 import time
 import json
+import math
 import struct
+import framebuf
 from neopixel import NeoPixel
 import uasyncio as asyncio
 import urequests
@@ -18,12 +20,47 @@ display = ssd1306.SSD1306_I2C(128, 64, i2c)
 
 num_pixels = 24
 flash_max_cycles = 50
+flash_interval_ms = 100  # Flash frequency = 10 Hz
+idle_timeout_ms = 5000  # Milliseconds without telemetry before showing idle animation
 
 # Load config
 conf = {}
 with open('config.json', 'r') as f:
     conf = json.load(f)
 
+# Bind the values read on every LED update once, instead of a dict lookup per call
+LED_BRIGHTNESS = conf['led_ring_brightness']
+LED_GREEN_BP = conf['led_green_breakpoint']
+LED_YELLOW_BP = conf['led_yellow_breakpoint']
+LED_REDLINE = conf['led_redline_flash_above']
+
+# Brightness as 8-bit fixed point, so scaling a channel is (c * b8) >> 8
+LED_B8 = int(LED_BRIGHTNESS * 256)
+LED_IDLE_B8 = LED_B8 >> 1
+LED_BRIGHTNESS_255 = (255 * LED_B8) >> 8
+
+# Gauge colors with brightness already applied
+GREEN = (0, LED_BRIGHTNESS_255, 0)
+YELLOW = (LED_BRIGHTNESS_255, LED_BRIGHTNESS_255, 0)
+RED = (LED_BRIGHTNESS_255, 0, 0)
+OFF = (0, 0, 0)
+
+# Color breakpoints as lit pixel counts, for callers that work in whole pixels
+LED_GREEN_LIT = math.ceil(LED_GREEN_BP * num_pixels)
+LED_YELLOW_LIT = math.ceil(LED_YELLOW_BP * num_pixels)
+
+def color_pattern(color, count):
+    """Raw NeoPixel buffer bytes for count pixels of color (driver order is GRB)"""
+    r, g, b = color
+    return bytes((g, r, b)) * count
+
+# Idle "breathing" frames, cyan at half brightness from 0% to 100% intensity
+# in 5% steps, precomputed so the animation only copies buffers
+IDLE_COLOR = (0, 150, 150)
+IDLE_FRAMES = []
+for i in range(0, 101, 5):
+    IDLE_FRAMES.append(color_pattern([((c * i // 100) * LED_IDLE_B8) >> 8 for c in IDLE_COLOR], num_pixels))
+
 SCHEMA_URL = "https://raw.githubusercontent.com/zhardie/shift-light/refs/heads/main/mcu/schemas.json"
 LOCAL_SCHEMA_FILE = "schemas.json"
 
@@ -33,47 +70,50 @@ connected = wifi.connect_wifi(ssid=conf['wifi_ssid'], password=conf['wifi_passwo
 display.fill(0)
 display.show()
 
-def set_color_all(r, g, b, brightness=conf['led_ring_brightness']):
+def set_color_all(r, g, b, b8=LED_B8):
     """
     Set all pixels to the same color
+
+    Args:
+        r, g, b: Integer channel values (0-255)
+        b8: Brightness in 8-bit fixed point (256 = full brightness)
     """
     # Apply brightness
-    r = int(r * brightness)
-    g = int(g * brightness)
-    b = int(b * brightness)
+    color = ((r * b8) >> 8, (g * b8) >> 8, (b * b8) >> 8)
     
-    for i in range(num_pixels):
-        np[i] = (r, g, b)
+    np.buf[:] = color_pattern(color, num_pixels)
     np.write()
 
-def display_gear(bitmap):
+def render_digits():
     """
-    Displays a bitmap digit scaled to fill the entire 128x64 display.
+    Scale every digit up to fill the display, rendered once into a raw
+    MONO_VLSB buffer (the SSD1306 layout) so showing a gear is a single
+    buffer copy instead of thousands of pixel() calls.
+    """
+    rendered = {}
+    for key, bitmap in digits.digits.items():
+        scale_x = display.width // len(bitmap[0])
+        scale_y = display.height // len(bitmap)
+        buf = bytearray(display.width * display.height // 8)
+        fb = framebuf.FrameBuffer(buf, display.width, display.height, framebuf.MONO_VLSB)
+        for y in range(len(bitmap)):
+            for x in range(len(bitmap[0])):
+                if bitmap[y][x] == 1:
+                    fb.fill_rect(x * scale_x, y * scale_y, scale_x, scale_y, 1)
+        rendered[key] = buf
+    return rendered
+
+rendered_digits = render_digits()
+
+def display_gear(bitmap_key):
+    """
+    Displays a digit scaled to fill the entire 128x64 display.
     
     Args:
-        bitmap: A 2D list representing the digit (should be 16x8)
+        bitmap_key: Key of the digit in rendered_digits
     """
-    # Clear the display
-    display.fill(0)
-    
-    # Get dimensions of the bitmap
-    height = len(bitmap)
-    width = len(bitmap[0])
-    
-    # Calculate scaling factor (should be 8 for 16x8 bitmap on 128x64 display)
-    scale_x = display.width // width
-    scale_y = display.height // height
-    
-    # Draw each pixel of the bitmap, scaled up
-    for y in range(height):
-        for x in range(width):
-            if bitmap[y][x] == 1:
-                # Draw a square of scale_x x scale_y pixels
-                for dy in range(scale_y):
-                    for dx in range(scale_x):
-                        display.pixel(x * scale_x + dx, y * scale_y + dy, 1)
-    
-    # Update the display
+    # The rendered digit covers the whole frame, so no clear is needed first
+    display.buffer[:] = rendered_digits[bitmap_key]
     display.show()
 
 def display_text(text, x=0, y=0, clear=True):
@@ -101,6 +141,35 @@ def save_local_schema(schema):
     except:
         return False
 
+def fetch_remote_schema_version():
+    """
+    Read only the start of the remote schema and pull its version out.
+
+    Returns None if the version can't be found in that prefix, in which case
+    the caller falls back to downloading the whole schema.
+    """
+    response = urequests.get(SCHEMA_URL, headers={"Range": "bytes=0-127"})
+    try:
+        if response.status_code not in (200, 206):
+            return None
+        head = response.raw.read(128)
+    finally:
+        response.close()
+
+    key = head.find(b'"version"')
+    if key < 0:
+        return None
+    colon = head.find(b':', key)
+    if colon < 0:
+        return None
+    value = head[colon + 1:].lstrip()
+    end = 0
+    while end < len(value) and 48 <= value[end] <= 57:  # ASCII digits
+        end += 1
+    if end == 0:
+        return None
+    return int(value[:end])
+
 def check_schema_update():
     """Check for schema updates and download if newer version available"""
     display_text("Checking for updates...")
@@ -110,17 +179,25 @@ def check_schema_update():
         local_schema = load_local_schema()
         local_version = local_schema.get("version", 0)
         
-        # Try to get remote schema info first to check version
+        # Check the remote version from a small prefix first, so the common
+        # "up to date" case never buffers the whole schema
+        remote_version = fetch_remote_schema_version()
+        if remote_version is not None and remote_version <= local_version:
+            display_text("Up to date", 0, 0)
+            time.sleep(1)
+            return local_schema
+
+        # Newer (or unknown) version, download and parse the full schema
+        gc.collect()
         response = urequests.get(SCHEMA_URL)
-        print(response.json())
         if response.status_code != 200:
+            response.close()
             display_text("Update check failed", 0, 0)
             time.sleep(1)
             return local_schema
             
         # Parse the remote schema
-        print(response)
-        remote_schema = response.json()
+        remote_schema = json.loads(response.content)
         response.close()
         remote_version = remote_schema.get("version", 0)
         
@@ -144,6 +221,16 @@ def check_schema_update():
         return local_schema
 
 class Gauge():
+    # Fixed attribute layout, no per-instance __dict__ (ignored by MicroPython)
+    __slots__ = (
+        'max_rpm', 'level', 'flashed', 'flash_cycles', 'increasing',
+        'in_idle_mode', 'telemetry_idle', 'last_data_ticks', 'detected_game',
+        'game_schemas',
+        '_by_length', '_unsigned', '_min_length', '_last_lit', '_last_color', '_gear_fb',
+        '_gear_fbs',
+        '_patterns', '_off_buf',
+    )
+
     def __init__(self):
         self.max_rpm = 3000
         self.level = 0
@@ -151,32 +238,106 @@ class Gauge():
         self.flash_cycles = 0
         self.increasing = True
         self.in_idle_mode = False
+        # Telemetry timeout state, set by sim_task and checked by the main loop
+        self.telemetry_idle = False
+        self.last_data_ticks = time.ticks_ms()
         self.detected_game = None
         self.game_schemas = {}
-        self.gear_map = {}
+        self._by_length = {}
+        self._unsigned = []
+        self._min_length = {}
+        self._last_lit = -1
+        self._last_color = None
+        self._gear_fb = {}
+        self._gear_fbs = {}
+        # Full-ring byte patterns, sliced straight into the NeoPixel buffer
+        self._patterns = {}
+        for color in (GREEN, YELLOW, RED, OFF):
+            self._patterns[color] = memoryview(color_pattern(color, num_pixels))
+        self._off_buf = self._patterns[OFF]
         
     def set_schemas(self, schemas):
         """Set the game schemas for the gauge"""
         self.game_schemas = schemas.get("games", {})
+
+        # Map each game's raw gear values straight to rendered digits, so the
+        # packet path is a single lookup with no str() or gear map hop
+        self._gear_fbs = {}
+        for game_id, schema in self.game_schemas.items():
+            gear_fb = self._gear_fbs[game_id] = {}
+            gear_info = schema.get("fields", {}).get("gear", None)
+            if gear_info:
+                for gear_key, digit in gear_info.get("map", {}).items():
+                    try:
+                        gear_key = int(gear_key)
+                    except ValueError:
+                        pass
+                    if digit in rendered_digits:
+                        gear_fb[gear_key] = rendered_digits[digit]
+                    else:
+                        print(f"No digit '{digit}' for gear {gear_key} in {game_id}")
+
+        # Index optional packet signatures by length so detection only tries
+        # schemas that can match, e.g.
+        # "signature": {"length": 264, "probe_offset": 0, "probe_bytes": "00ff"}
+        self._by_length = {}
+        self._unsigned = []
+        for game_id, schema in self.game_schemas.items():
+            signature = schema.get("signature", None)
+            if signature:
+                # A bad signature must not stop the gauge from booting, fall
+                # back to treating the schema as unsigned instead
+                length = signature.get("length", None)
+                probe_offset = signature.get("probe_offset", 0)
+                try:
+                    probe_bytes = bytes.fromhex(signature.get("probe_bytes", ""))
+                except (TypeError, ValueError):
+                    probe_bytes = None
+                if isinstance(length, int) and isinstance(probe_offset, int) and probe_bytes is not None:
+                    self._by_length.setdefault(length, []).append((game_id, probe_offset, probe_bytes))
+                    continue
+                print(f"Invalid signature for {game_id}, ignoring it")
+            self._unsigned.append(game_id)
+
+        # The receive buffer is reused, so bytes past the packet length are
+        # left over from older packets. Record how long a packet must be to
+        # hold every field, and reject shorter ones instead of reading those
+        self._min_length = {}
+        for game_id, schema in self.game_schemas.items():
+            min_length = 0
+            try:
+                for info in schema.get("fields", {}).values():
+                    min_length = max(min_length, info["offset"] + struct.calcsize(info["format"]))
+            except (KeyError, TypeError, ValueError):
+                # Leave a bad field to fail in the unpack itself
+                pass
+            self._min_length[game_id] = min_length
         
-    def detect_game(self, data):
-        """Detect which game sent the data"""
+    def detect_game(self, data, length):
+        """Detect which game sent the data (the first length bytes of the receive buffer)"""
         if self.detected_game:
             # We already have a detected game, use its schema
             return self.detected_game
             
-        for game_id, schema in self.game_schemas.items():
+        # Schemas whose signature matches come first, then the ones without a
+        # signature fall back to the trial unpack below
+        candidates = []
+        for game_id, probe_offset, probe_bytes in self._by_length.get(length, ()):
+            if data[probe_offset:probe_offset + len(probe_bytes)] == probe_bytes:
+                candidates.append(game_id)
+        candidates.extend(self._unsigned)
+
+        for game_id in candidates:
+            schema = self.game_schemas[game_id]
             try:
                 # Try to unpack according to schema signature
-                gear, rpm, max_rpm = self.unpack_game_data(game_id, data)
+                gear, rpm, max_rpm = self.unpack_game_data(game_id, data, length)
                 
                 if gear in [-1, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10] and (0 < rpm < 20000):                
                     # Game detected!
                     self.detected_game = game_id
                     print(f"Game: {schema.get('name', game_id)}")
-                    fields = schema.get("fields", {})
-                    gear_info = fields["gear"]
-                    self.gear_map = gear_info['map']
+                    self._gear_fb = self._gear_fbs[game_id]
                     if max_rpm:
                         self.max_rpm = max_rpm
                     return game_id
@@ -186,11 +347,15 @@ class Gauge():
         
         return None
         
-    def unpack_game_data(self, game_id, data):
-        """Unpack data according to the schema for the identified game"""
+    def unpack_game_data(self, game_id, data, length):
+        """Unpack the first length bytes of data according to the schema for the identified game"""
         if game_id not in self.game_schemas:
             return None, None
 
+        if length < self._min_length[game_id]:
+            # Too short for this schema, the rest of the buffer is stale
+            return None, None, None
+
         schema = self.game_schemas[game_id]
         fields = schema.get("fields", {})
         gear_info = fields["gear"]
@@ -214,91 +379,106 @@ class Gauge():
         self.level = level
         lit_pixels = int(num_pixels * level)
 
-        r, g, b = (0, 0, 0)
+        # Determine color based on level
+        if level < LED_GREEN_BP:
+            color = GREEN
+        elif level < LED_YELLOW_BP:
+            color = YELLOW
+        else:
+            color = RED
+
+        self._draw_gauge(lit_pixels, color)
+
+    def _set_gauge_lit(self, lit_pixels):
+        """Light lit_pixels LEDs directly, without going through a 0-1 level"""
+        self.in_idle_mode = False
+        self.flashed = False
 
-        # Determine base colors based on level
-        if level < conf['led_green_breakpoint']:
-            r, g, b = 0, 255, 0  # Green
-        elif level < conf['led_yellow_breakpoint']:
-            r, g, b = 255, 255, 0  # Yellow
+        if lit_pixels < LED_GREEN_LIT:
+            color = GREEN
+        elif lit_pixels < LED_YELLOW_LIT:
+            color = YELLOW
         else:
-            r, g, b = 255, 0, 0  # Red
-        
-        # Apply brightness
-        r = int(r * conf['led_ring_brightness'])
-        g = int(g * conf['led_ring_brightness'])
-        b = int(b * conf['led_ring_brightness'])
-        
-        # Clear all pixels
-        for i in range(num_pixels):
-            if i < lit_pixels:
-                np[i] = (r, g, b)
+            color = RED
+
+        self._draw_gauge(lit_pixels, color)
+
+    def _draw_gauge(self, lit_pixels, color):
+        # Nothing changed since the last update, skip the LED transmit
+        if color == self._last_color and lit_pixels == self._last_lit:
+            return
+
+        buf = np.buf
+        lit_end = lit_pixels * 3
+        if color == self._last_color:
+            # Same color, only the pixels between the old and new level change
+            old_end = self._last_lit * 3
+            if lit_end > old_end:
+                buf[old_end:lit_end] = self._patterns[color][old_end:lit_end]
             else:
-                np[i] = (0, 0, 0)
+                buf[lit_end:old_end] = self._off_buf[lit_end:old_end]
+        else:
+            buf[:lit_end] = self._patterns[color][:lit_end]
+            buf[lit_end:] = self._off_buf[lit_end:]
         np.write()
+
+        self._last_lit = lit_pixels
+        self._last_color = color
+
+    def invalidate_leds(self):
+        """Force the next set_gauge_level to redraw the whole ring"""
+        self._last_lit = -1
+        self._last_color = None
     
     def set_flash(self):
-        for i in range(num_pixels):
-            np[i] = (0, 0, 0)
+        np.buf[:] = self._off_buf
         np.write()
-
-    async def check_redline(self):
-        while True:
-            # Skip redline checking if we're in idle mode
-            if not self.in_idle_mode:
-                current_level = self.level  # Store current level
-
-                if current_level >= conf['led_redline_flash_above']:  # If at or above redline
-                    # Flash pattern - alternate between off and on
-                    if self.flash_cycles % 2 == 0:  # Even cycles = LED off
-                        # Store current LEDs state before turning off
-                        current_pixels = []
-                        for i in range(num_pixels):
-                            current_pixels.append(np[i])
-                        
-                        # Turn off all LEDs
-                        for i in range(num_pixels):
-                            np[i] = (0, 0, 0)
-                        np.write()
-                    else:  # Odd cycles = LEDs on (bright red)
-                        # Set all active LEDs to bright red
-                        lit_pixels = int(num_pixels * current_level)
-                        r = int(255 * conf['led_ring_brightness'])
-                        g = 0
-                        b = 0
-                        
-                        for i in range(num_pixels):
-                            if i < lit_pixels:
-                                np[i] = (r, g, b)
-                            else:
-                                np[i] = (0, 0, 0)
-                        np.write()
-                    
-                    self.flash_cycles += 1
-                    if self.flash_cycles >= flash_max_cycles:
-                        self.flash_cycles = 0
-                        
-                # If not above redline, reset flash counter but don't change LEDs
-                # (sim_task will handle normal gauge display)
-                else:
-                    self.flash_cycles = 0
+        self.invalidate_leds()
+
+    def redline_tick(self):
+        """Advance the redline flash by one step, called every flash_interval_ms"""
+        # Skip redline checking if we're in idle mode
+        if self.in_idle_mode:
+            return
+
+        current_level = self.level  # Store current level
+
+        if current_level >= LED_REDLINE:  # If at or above redline
+            # Flash pattern - alternate between off and on
+            if self.flash_cycles % 2 == 0:  # Even cycles = LED off
+                # Turn off all LEDs, the odd cycle redraws them from scratch
+                np.buf[:] = self._off_buf
+                np.write()
+            else:  # Odd cycles = LEDs on (bright red)
+                # Set all active LEDs to bright red
+                lit_end = int(num_pixels * current_level) * 3
+                np.buf[:lit_end] = self._patterns[RED][:lit_end]
+                np.buf[lit_end:] = self._off_buf[lit_end:]
+                np.write()
+            self.invalidate_leds()
             
-            # Short delay for flashing effect (adjust as needed)
-            await asyncio.sleep_ms(100)  # Flash frequency = 10 Hz
+            self.flash_cycles += 1
+            if self.flash_cycles >= flash_max_cycles:
+                self.flash_cycles = 0
+                
+        # If not above redline, reset flash counter but don't change LEDs
+        # (sim_task will handle normal gauge display)
+        else:
+            self.flash_cycles = 0
 
     def gauge_sweep(self, times=2):
         interval_ms = 20/1000 # 100 ms
         for t in range(0, times, 1):
-            for level in range(0, 101, 4):
-                self.set_gauge_level(level/100.0)
+            for lit in range(0, num_pixels + 1):
+                self._set_gauge_lit(lit)
                 time.sleep(interval_ms)
-            for level in range(101, 0, -4):
-                self.set_gauge_level(level/100.0)
+            for lit in range(num_pixels, -1, -1):
+                self._set_gauge_lit(lit)
                 time.sleep(interval_ms)
 
     def gear_range(self):
         for d in '123456NR':
-            display_gear(digits.digits[d])
+            display_gear(d)
             time.sleep(50/1000)
 
 async def sim_task(gauge):
@@ -306,92 +486,99 @@ async def sim_task(gauge):
     port = 20777
     sock = None
     
-    # Idle state tracking
-    last_data_time = time.time()
-    idle_timeout = 5  # Seconds before showing idle animation
-    is_idle_mode = False
-    
     try:
         # Create socket once outside the loop
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.bind((conf['sim_ip'], port))
         sock.setblocking(False)
         print(f"Listening for telemetry on port {port}")
+
+        # The idle timeout counts from when we start listening, not from boot
+        gauge.last_data_ticks = time.ticks_ms()
         
         last_gear = None
+
+        # Every packet is read into this one buffer, so receiving allocates
+        # nothing per packet
+        packet = bytearray(512)
+
+        # Bind the per-packet lookups once, outside the hot loop. The stream
+        # read parks this task on the IO poller until a packet arrives, so
+        # the loop only wakes when there is telemetry
+        readinto = asyncio.StreamReader(sock).readinto
+        sock_readinto = sock.readinto
+        ticks_ms = time.ticks_ms
+        set_level = gauge.set_gauge_level
+        detect = gauge.detect_game
+        unpack = gauge.unpack_game_data
         
         while True:
+            # A receive error must not close the socket and end the task
             try:
-                data_received = False
-                
-                # Try to receive data
+                length = await readinto(packet)
+            except OSError as e:
+                print(f"Receive error: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            # Drain everything queued behind it and keep only the newest
+            # packet, older ones are already stale. Each read overwrites the
+            # buffer, so it ends up holding the newest one
+            while True:
                 try:
-                    data = sock.recv(512)
-                    
-                    # Try to detect which game is sending data
-                    game_id = gauge.detect_game(data)
-                    
-                    if game_id:
-                        # Process the data according to the game schema
-                        gear, rpm, max_rpm_from_packet = gauge.unpack_game_data(game_id, data)
-
-                        if rpm is not None and gear is not None:
-                            # Now handle max_rpm_from_packet
-                            if max_rpm_from_packet is not None: # If max_rpm was actually in the packet
-                                gauge.max_rpm = max_rpm_from_packet
-                            else: # Fallback to dynamic max_rpm if not in packet
-                                if rpm > gauge.max_rpm:
-                                    gauge.max_rpm = rpm
-                            
-                            # Data received, update last data time
-                            last_data_time = time.time()
-                            data_received = True
-                            
-                            # We were in idle mode but just received data
-                            if is_idle_mode:
-                                is_idle_mode = False
-                                gauge.in_idle_mode = False
-                                print("Telemetry received - exiting idle mode")
-                            
-                            # Calculate normalized rpm (0.0 to 1.0)
-                            rpm_normalized = rpm / gauge.max_rpm
-                            
-                            # Store the RPM level but only update display if not at redline
-                            gauge.level = rpm_normalized
-                            if rpm_normalized < conf['led_redline_flash_above']:
-                                gauge.set_gauge_level(rpm_normalized)
-
-                            # Update gear display only when gear changes
-                            gear_str = str(gear) if isinstance(gear, int) else gear
-                            if gear != last_gear:
-                                display_gear(digits.digits[gauge.gear_map[gear_str]])
-                                last_gear = gear
-                    
+                    n = sock_readinto(packet)
                 except OSError:
-                    # No data available yet
-                    pass
-                
-                # Check if we should switch to idle mode
-                current_time = time.time()
-                if not data_received and not is_idle_mode and (current_time - last_data_time) > idle_timeout:
-                    # Switch to idle mode
-                    is_idle_mode = True
-                    gauge.in_idle_mode = True
-                    gauge.detected_game = None  # Clear detected game when idle
-                    gauge.max_rpm = 3000
-                    print("No telemetry received for 5 seconds - entering idle mode")
-                    display.fill(0)
-                    display.show()
-                    
-                    # Create and run the idle animation asynchronously
-                    if conf['allow_idle_animations']:
-                        asyncio.create_task(run_idle_animation(gauge))
-                    else:
-                        set_color_all(0, 0, 0)
-                
-                # Short delay before next iteration
-                await asyncio.sleep_ms(10)
+                    # Receive error, keep the newest packet we already have
+                    break
+                if not n:
+                    # No more data available
+                    break
+                length = n
+
+            if not length:
+                continue
+
+            try:
+                # Try to detect which game is sending data
+                game_id = detect(packet, length)
                 
+                if game_id:
+                    # Process the data according to the game schema, straight
+                    # from the receive buffer
+                    gear, rpm, max_rpm_from_packet = unpack(game_id, packet, length)
+
+                    if rpm is not None and gear is not None:
+                        # Now handle max_rpm_from_packet
+                        if max_rpm_from_packet is not None: # If max_rpm was actually in the packet
+                            gauge.max_rpm = max_rpm_from_packet
+                        else: # Fallback to dynamic max_rpm if not in packet
+                            if rpm > gauge.max_rpm:
+                                gauge.max_rpm = rpm
+                        
+                        # Data received, update last data time
+                        gauge.last_data_ticks = ticks_ms()
+                        
+                        # We were in idle mode but just received data
+                        if gauge.telemetry_idle:
+                            gauge.telemetry_idle = False
+                            gauge.in_idle_mode = False
+                            print("Telemetry received - exiting idle mode")
+                        
+                        # Calculate normalized rpm (0.0 to 1.0)
+                        rpm_normalized = rpm / gauge.max_rpm
+                        
+                        # Store the RPM level but only update display if not at redline
+                        gauge.level = rpm_normalized
+                        if rpm_normalized < LED_REDLINE:
+                            set_level(rpm_normalized)
+
+                        # Update gear display only when gear changes
+                        if gear != last_gear:
+                            fb = gauge._gear_fb.get(gear)
+                            if fb is not None:
+                                display.buffer[:] = fb
+                                display.show()
+                            last_gear = gear
             except Exception as e:
                 print(f"Error processing data: {e}")
                 await asyncio.sleep(1)
@@ -405,30 +592,32 @@ async def run_idle_animation(gauge):
     """Run the idle animation until telemetry data is received again"""
     # Set a flag to indicate we're in idle mode
     gauge.in_idle_mode = True
-    
-    # Use a cyan color for the idle animation
-    r, g, b = 0, 150, 150
+
+    # Bind the per-frame lookups once
+    buf = np.buf
+    np_write = np.write
+    sleep_ms = asyncio.sleep_ms
     
     try:
         # Run the idle animation until we're no longer in idle mode
-        while getattr(gauge, 'in_idle_mode', True):
+        while gauge.in_idle_mode:
             # Breathe in
-            for i in range(0, 101, 5):
-                if not getattr(gauge, 'in_idle_mode', True):
+            for frame in IDLE_FRAMES:
+                if not gauge.in_idle_mode:
                     break
                     
-                intensity = i / 100.0
-                set_color_all(r * intensity, g * intensity, b * intensity, conf['led_ring_brightness'] * 0.5)
-                await asyncio.sleep_ms(50)
+                buf[:] = frame
+                np_write()
+                await sleep_ms(50)
                 
             # Breathe out
-            for i in range(100, -1, -5):
-                if not getattr(gauge, 'in_idle_mode', True):
+            for frame in reversed(IDLE_FRAMES):
+                if not gauge.in_idle_mode:
                     break
                     
-                intensity = i / 100.0
-                set_color_all(r * intensity, g * intensity, b * intensity, conf['led_ring_brightness'] * 0.5)
-                await asyncio.sleep_ms(50)
+                buf[:] = frame
+                np_write()
+                await sleep_ms(50)
     finally:
         # Reset the flag when we exit the idle animation
         gauge.in_idle_mode = False
@@ -446,10 +635,41 @@ async def main():
     gauge.gauge_sweep(1)
 
     sim_task_handle = asyncio.create_task(sim_task(gauge))
-    redline_task = asyncio.create_task(gauge.check_redline())
 
-    while True: # main loop
-        await asyncio.sleep(5)
+    # Bind the per-iteration lookups once, outside the loop
+    sleep_ms = asyncio.sleep_ms
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    redline_tick = gauge.redline_tick
+
+    while True: # main loop, also drives the redline flash and the idle timeout
+        # The LED ring and OLED are driven here, a glitch on either
+        # (e.g. an I2C OSError from a loose display) must not end the loop
+        try:
+            redline_tick()
+
+            # Check if we should switch to idle mode
+            if not gauge.telemetry_idle and ticks_diff(ticks_ms(), gauge.last_data_ticks) > idle_timeout_ms:
+                # Switch to idle mode
+                gauge.telemetry_idle = True
+                gauge.in_idle_mode = True
+                gauge.detected_game = None  # Clear detected game when idle
+                gauge.max_rpm = 3000
+                gauge.invalidate_leds()
+                print("No telemetry received for 5 seconds - entering idle mode")
+                display.fill(0)
+                display.show()
+                
+                # Create and run the idle animation asynchronously
+                if conf['allow_idle_animations']:
+                    asyncio.create_task(run_idle_animation(gauge))
+                else:
+                    set_color_all(0, 0, 0)
+        except Exception as e:
+            print(f"Error updating display: {e}")
+            await asyncio.sleep(1)
+
+        await sleep_ms(flash_interval_ms)
 
 if __name__ == "__main__":
     asyncio.run(main())